@@ -1,6 +1,8 @@
 from __future__ import annotations
 import os
+import threading
 from typing import Optional
+import numpy as np
 import pandas as pd
 import requests
 from fastapi import FastAPI, HTTPException
@@ -12,10 +14,11 @@ from backend.schemas import (
     CounterfactualRequest, CounterfactualResponse,
     BatchCounterfactualRequest, SlackTriggerRequest,
     MetadataResponse, ExplainResponse, FeatureImportance,
-    RecommendationResponse
+    RecommendationResponse, DriftResponse
 )
-from backend.model import load_model, predict_proba, get_feature_importance, FEATURE_COLS
+from backend.model import load_model, predict_proba, get_feature_importance, FEATURE_COLS, MODEL_PATH
 from backend.counterfactual import apply_counterfactual
+from backend.monitor import DriftMonitor, load_reference, reference_path
 from backend.auth import router as auth_router
 
 BASE_CUSTOMERS_CSV = os.getenv("BASE_CUSTOMERS_CSV", os.path.join(os.path.dirname(__file__), "..", "outputs", "customers_base.csv"))
@@ -41,6 +44,8 @@ if os.path.isdir(EXT_DIR):
 
 _model = None
 _base_df: Optional[pd.DataFrame] = None
+_monitor: Optional[DriftMonitor] = None
+_monitor_lock = threading.Lock()
 
 def get_model():
     global _model
@@ -56,6 +61,24 @@ def get_base_df():
         _base_df = pd.read_csv(BASE_CUSTOMERS_CSV)
     return _base_df
 
+def get_monitor() -> Optional[DriftMonitor]:
+    # Scoring must keep working without a reference, so a missing file just disables monitoring.
+    # Endpoints run in a threadpool; the lock stops a second thread replacing a monitor that already has counts.
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                try:
+                    _monitor = DriftMonitor(load_reference(reference_path(MODEL_PATH)))
+                except FileNotFoundError:
+                    return None
+    return _monitor
+
+def observe(df: pd.DataFrame, risk: np.ndarray) -> None:
+    monitor = get_monitor()
+    if monitor is not None:
+        monitor.update(df, risk)
+
 @app.get("/")
 def root():
     """Root endpoint - API is running"""
@@ -69,7 +92,8 @@ def root():
             "metadata": "/metadata/features, /metadata/customers",
             "prediction": "/predict, /predict/explain",
             "counterfactual": "/counterfactual, /batch_counterfactual",
-            "actions": "/action/trigger"
+            "actions": "/action/trigger",
+            "monitoring": "/monitor/drift, /monitor/reset"
         }
     }
 
@@ -92,7 +116,9 @@ def list_customers():
 def explain(req: PredictRequest):
     model = get_model()
     df = pd.DataFrame([req.model_dump()])
-    p = float(predict_proba(model, df)[0])
+    risk = predict_proba(model, df)
+    observe(df, risk)
+    p = float(risk[0])
     
     # For local explanation, we'll just return global for now 
     # but could be improved with SHAP
@@ -108,7 +134,9 @@ def explain(req: PredictRequest):
 def predict(req: PredictRequest):
     model = get_model()
     df = pd.DataFrame([req.model_dump()])
-    p = float(predict_proba(model, df)[0])
+    risk = predict_proba(model, df)
+    observe(df, risk)
+    p = float(risk[0])
     return PredictResponse(customer_id=req.customer_id, churn_risk=p)
 
 @app.get("/customer/{customer_id}", response_model=PredictRequest)
@@ -165,6 +193,21 @@ def batch_counterfactual(req: BatchCounterfactualRequest):
     out = out.sort_values(["regret_score","delta_risk"], ascending=False).head(req.top_n or 50)
     return {"timing_days": req.timing_days, "action_type": req.action_type, "rows": out.to_dict(orient="records")}
 
+@app.get("/monitor/drift", response_model=DriftResponse)
+def monitor_drift():
+    monitor = get_monitor()
+    if monitor is None:
+        raise HTTPException(status_code=404, detail="Monitor reference not found. Run scripts/run_demo.py first.")
+    return DriftResponse(**monitor.report())
+
+@app.post("/monitor/reset")
+def monitor_reset():
+    monitor = get_monitor()
+    if monitor is None:
+        raise HTTPException(status_code=404, detail="Monitor reference not found. Run scripts/run_demo.py first.")
+    monitor.reset()
+    return {"ok": True}
+
 @app.post("/action/trigger")
 def trigger_action(req: SlackTriggerRequest):
     if not SLACK_WEBHOOK_URL:
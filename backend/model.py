@@ -11,6 +11,8 @@ from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.model_selection import StratifiedKFold
 from sklearn.inspection import permutation_importance
 
+from backend.monitor import build_reference, save_reference, reference_path
+
 MODEL_PATH = os.getenv("MODEL_PATH", os.path.join(os.path.dirname(__file__), "..", "outputs", "model.joblib"))
 
 NUM_COLS = ["tenure_months","arpu","sessions_30d","usage_drop_30d_pct","tickets_30d","csat_30d","failed_payments_90d"]
@@ -48,7 +50,10 @@ def train_and_save(train_csv: str, target_col: str = "churned") -> dict:
 
     os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
     joblib.dump(model, MODEL_PATH)
-    return {"cv_auc": float(auc), "model_path": MODEL_PATH}
+
+    # Out-of-fold risk is a closer stand-in for live scores than in-sample predictions.
+    ref_path = save_reference(build_reference(X, oof, NUM_COLS, CAT_COLS), reference_path(MODEL_PATH))
+    return {"cv_auc": float(auc), "model_path": MODEL_PATH, "reference_path": ref_path}
 
 def load_model() -> Pipeline:
     if not os.path.exists(MODEL_PATH):
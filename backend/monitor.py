@@ -0,0 +1,149 @@
+from __future__ import annotations
+import os
+import threading
+import joblib
+import numpy as np
+import pandas as pd
+
+REFERENCE_FILENAME = "monitor_reference.joblib"
+
+# Live counts decay so recent traffic dominates: a row's weight halves after this many newer rows.
+HALF_LIFE_ROWS = float(os.getenv("MONITOR_HALF_LIFE_ROWS", "2000"))
+if not HALF_LIFE_ROWS > 0:
+    raise ValueError(f"MONITOR_HALF_LIFE_ROWS must be > 0, got {HALF_LIFE_ROWS}")
+
+N_NUM_BINS = 10
+RISK_EDGES = np.linspace(0.0, 1.0, 11)[1:-1]
+EPS = 1e-4
+
+def _quantile_edges(values: np.ndarray, n_bins: int = N_NUM_BINS) -> np.ndarray:
+    # Interior edges only; the outer bins are open-ended so live values outside
+    # the training range still land somewhere.
+    qs = np.quantile(values, np.linspace(0.0, 1.0, n_bins + 1)[1:-1])
+    return np.unique(qs)
+
+def _bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    idx = np.searchsorted(edges, values, side="right")
+    return np.bincount(idx, minlength=len(edges) + 1).astype(np.int64)
+
+def _category_index(categories: list) -> dict:
+    return {c: i for i, c in enumerate(categories)}
+
+def _cat_counts(values: pd.Series, index: dict) -> np.ndarray:
+    # Unseen categories go to the trailing overflow bucket. A plain dict lookup
+    # is much cheaper than pd.Categorical/get_indexer for single-row requests.
+    other = len(index)
+    codes = np.fromiter((index.get(str(v), other) for v in values.to_numpy()), dtype=np.intp, count=len(values))
+    return np.bincount(codes, minlength=other + 1).astype(np.int64)
+
+def build_reference(df: pd.DataFrame, risk: np.ndarray, num_cols: list, cat_cols: list) -> dict:
+    num = {}
+    for c in num_cols:
+        edges = _quantile_edges(df[c].to_numpy(dtype=float))
+        num[c] = {"edges": edges, "counts": _bin_counts(df[c].to_numpy(dtype=float), edges)}
+    cat = {}
+    for c in cat_cols:
+        categories = sorted(df[c].astype(str).unique().tolist())
+        cat[c] = {"categories": categories, "counts": _cat_counts(df[c], _category_index(categories))}
+    risk = np.asarray(risk, dtype=float)
+    return {
+        "n": int(len(df)),
+        "num": num,
+        "cat": cat,
+        "risk": {"edges": RISK_EDGES, "counts": _bin_counts(risk, RISK_EDGES)},
+    }
+
+def reference_path(model_path: str) -> str:
+    # Keep the reference beside the model it was built with unless explicitly overridden.
+    return os.getenv("MONITOR_REFERENCE_PATH") or os.path.join(os.path.dirname(model_path), REFERENCE_FILENAME)
+
+def save_reference(reference: dict, path: str) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    joblib.dump(reference, path)
+    return path
+
+def load_reference(path: str) -> dict:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Monitor reference not found at {path}. Run scripts/run_demo.py first.")
+    return joblib.load(path)
+
+def psi(ref_counts: np.ndarray, cur_counts: np.ndarray) -> float:
+    p = ref_counts / max(ref_counts.sum(), 1)
+    q = cur_counts / max(cur_counts.sum(), 1)
+    p = np.clip(p, EPS, None)
+    q = np.clip(q, EPS, None)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+def ks(ref_counts: np.ndarray, cur_counts: np.ndarray) -> float:
+    # Two-sample KS evaluated at the bin edges, i.e. on the binned CDFs.
+    p = np.cumsum(ref_counts) / max(ref_counts.sum(), 1)
+    q = np.cumsum(cur_counts) / max(cur_counts.sum(), 1)
+    return float(np.max(np.abs(p - q)))
+
+class DriftMonitor:
+    """Fixed-memory, exponentially decayed histograms of scored traffic, compared against the training reference."""
+
+    def __init__(self, reference: dict, half_life_rows: float = HALF_LIFE_ROWS):
+        if not half_life_rows > 0:
+            raise ValueError(f"half_life_rows must be > 0, got {half_life_rows}")
+        self.reference = reference
+        self.half_life_rows = half_life_rows
+        self._cat_index = {c: _category_index(v["categories"]) for c, v in reference["cat"].items()}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        ref = self.reference
+        with self._lock:
+            self.n = 0
+            self.num = {c: np.zeros(len(v["counts"])) for c, v in ref["num"].items()}
+            self.cat = {c: np.zeros(len(v["counts"])) for c, v in ref["cat"].items()}
+            self.risk = np.zeros(len(ref["risk"]["counts"]))
+
+    def update(self, df: pd.DataFrame, risk: np.ndarray) -> None:
+        ref = self.reference
+        num = {c: _bin_counts(df[c].to_numpy(dtype=float), v["edges"]) for c, v in ref["num"].items()}
+        cat = {c: _cat_counts(df[c], idx) for c, idx in self._cat_index.items()}
+        risk_counts = _bin_counts(np.asarray(risk, dtype=float), ref["risk"]["edges"])
+        decay = 0.5 ** (len(df) / self.half_life_rows)
+        with self._lock:
+            self.n += len(df)
+            for c in num:
+                self.num[c] *= decay
+                self.num[c] += num[c]
+            for c in cat:
+                self.cat[c] *= decay
+                self.cat[c] += cat[c]
+            self.risk *= decay
+            self.risk += risk_counts
+
+    def report(self) -> dict:
+        ref = self.reference
+        with self._lock:
+            n = self.n
+            num = {c: v.copy() for c, v in self.num.items()}
+            cat = {c: v.copy() for c, v in self.cat.items()}
+            risk = self.risk.copy()
+
+        # Nothing scored yet: report the layout but no statistics.
+        def stats(r, cur, with_ks=True):
+            if n == 0:
+                return None, None
+            return psi(r, cur), (ks(r, cur) if with_ks else None)
+
+        features = []
+        for c, v in ref["num"].items():
+            p, k = stats(v["counts"], num[c])
+            features.append({"feature": c, "kind": "numeric", "psi": p, "ks": k})
+        for c, v in ref["cat"].items():
+            p, k = stats(v["counts"], cat[c], with_ks=False)
+            features.append({"feature": c, "kind": "categorical", "psi": p, "ks": k})
+        p, k = stats(ref["risk"]["counts"], risk)
+        return {
+            "n_observed": n,
+            "n_effective": float(risk.sum()),
+            "half_life_rows": self.half_life_rows,
+            "n_reference": ref["n"],
+            "features": features,
+            "risk": {"feature": "churn_risk", "kind": "numeric", "psi": p, "ks": k},
+        }
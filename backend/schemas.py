@@ -63,3 +63,17 @@ class RecommendationResponse(BaseModel):
     new_risk: float
     improvement: float
     reasoning: str
+
+class FeatureDrift(BaseModel):
+    feature: str
+    kind: Literal["numeric", "categorical"]
+    psi: Optional[float] = None
+    ks: Optional[float] = None  # Only defined for numeric features
+
+class DriftResponse(BaseModel):
+    n_observed: int  # Rows seen since the last reset
+    n_effective: float  # Decayed weight actually behind the statistics
+    half_life_rows: float
+    n_reference: int
+    features: List[FeatureDrift]
+    risk: FeatureDrift